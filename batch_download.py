@@ -8,26 +8,191 @@
 import os
 import sys
 import argparse
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import yt_dlp
 
-def download_videos(urls_file, output_dir="downloads"):
+_print_lock = threading.Lock()
+
+class _ThreadOutput:
+    """Stand-in for sys.stdout that can buffer each worker thread's output separately"""
+    # contextlib.redirect_stdout swaps sys.stdout for every thread, so it can't do this
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def start_log(self):
+        """Send the calling thread's output to a fresh buffer"""
+        self._local.log = io.StringIO()
+    
+    def end_log(self):
+        """Stop buffering the calling thread's output and return what it wrote"""
+        log, self._local.log = self._local.log, None
+        return log.getvalue()
+    
+    def write(self, text):
+        log = getattr(self._local, 'log', None)
+        return (self.stream if log is None else log).write(text)
+    
+    def flush(self):
+        if getattr(self._local, 'log', None) is None:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def _download_one(url, opts, local, instances, action=None):
+    """Download a single URL with the calling thread's YoutubeDL instance; returns (error, log)"""
+    output = sys.stdout if isinstance(sys.stdout, _ThreadOutput) else None
+    if output:
+        output.start_log()
+    try:
+        _run_one(url, opts, local, instances, action)
+        error = None
+    except Exception as e:
+        error = e
+    log = output.end_log() if output else ""
+    return error, log
+
+def _run_one(url, opts, local, instances, action=None):
+    """Run the download or action for a single URL"""
+    # YoutubeDL isn't safe to share between threads, but each worker thread can
+    # reuse its own instance across URLs instead of rebuilding it every time
+    ydl = getattr(local, 'ydl', None)
+    if ydl is None:
+        ydl = local.ydl = yt_dlp.YoutubeDL(opts)
+        instances.append(ydl)
+    if action is None:
+        ydl.download([url])
+    else:
+        action(url, ydl)
+
+def download_and_remix(url, ydl, remixer, show_progress=True, threads=None):
+    """
+    Remix a video straight from the network, without saving the download
+    
+    FFmpeg reads the media URL resolved by yt-dlp over HTTP, so downloading
+    overlaps with encoding and no intermediate file is written. Unlike piping
+    through stdin, HTTP input can seek, so MP4s with a trailing moov atom work.
+    """
+    info = ydl.extract_info(url, download=False)
+    if not info or not info.get('url'):
+        raise RuntimeError("no single-file format available to stream")
+    
+    media_url = info['url']
+    headers = dict(info.get('http_headers') or {})
+    cookie_header = ydl.cookiejar.get_cookie_header(media_url)
+    if cookie_header:
+        headers['Cookie'] = cookie_header
+    header_lines = "".join(f"{key}: {value}\r\n" for key, value in headers.items())
+    input_args = ["-headers", header_lines] if header_lines else []
+    
+    name = f"{info.get('title', 'video')}-{info.get('id', '')}"
+    success, _ = remixer.process_video(media_url, threads=threads, show_progress=show_progress,
+                                       input_args=input_args, name=name)
+    if not success:
+        raise RuntimeError("remix failed")
+
+def _download_all(urls, ydl_opts, concurrency=4, action=None, buffer_output=False):
+    """Download URLs concurrently and return (successful, failed) counts
+    
+    With buffer_output, each URL's output is collected and printed in one
+    piece with its status line instead of interleaving across threads.
+    """
+    successful = 0
+    failed = 0
+    local = threading.local()
+    instances = []
+    
+    # Fetch HLS/DASH fragments in parallel too; this composes with the URL-level pool
+    ydl_opts = {
+        'concurrent_fragment_downloads': 4,
+        'fragment_retries': 10,
+        **ydl_opts,
+    }
+    
+    stdout = sys.stdout
+    if buffer_output:
+        sys.stdout = _ThreadOutput(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+            futures = {ex.submit(_download_one, url, ydl_opts, local, instances, action): url
+                       for url in urls}
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                error, log = future.result()
+                with _print_lock:
+                    print(log, end="")
+                    if error is None:
+                        print(f"\n[{i}/{len(urls)}] Finished: {url}")
+                        successful += 1
+                    else:
+                        print(f"\n[{i}/{len(urls)}] Failed: {url}")
+                        print(f"   Error: {str(error)}")
+                        failed += 1
+    finally:
+        sys.stdout = stdout
+    
+    for ydl in instances:
+        ydl.close()
+    
+    return successful, failed
+
+def _load_urls(path):
+    """Read URLs from a text file, skipping empty lines and # comments"""
+    with open(path, 'r') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def _as_url_list(urls):
+    """Accept either a path to a URL file or an already loaded list of URLs"""
+    if isinstance(urls, (str, os.PathLike)):
+        if not os.path.exists(urls):
+            print(f"Error: File '{urls}' not found")
+            return None
+        return _load_urls(urls)
+    return list(urls)
+
+def build_ydl_opts(output_dir="downloads", audio_only=False, quality="best"):
+    """Build yt-dlp options for the requested format"""
+    ydl_opts = {
+        'outtmpl': os.path.join(output_dir, '%(title)s-%(id)s.%(ext)s'),
+        'quiet': False,
+        'no_warnings': False,
+        'ignoreerrors': True,
+        'continue': True,
+    }
+    
+    if audio_only:
+        ydl_opts['format'] = 'bestaudio/best'
+        ydl_opts['postprocessors'] = [{
+            'key': 'FFmpegExtractAudio',
+            'preferredcodec': 'mp3',
+            'preferredquality': '192',
+        }]
+    elif quality != 'best':
+        ydl_opts['format'] = f'best[height<={quality}]/best'
+    
+    return ydl_opts
+
+def download_videos(urls, output_dir="downloads", concurrency=4, ydl_opts=None):
     """
     Download videos from URLs listed in a text file
     
     Args:
-        urls_file: Path to text file containing URLs (one per line)
+        urls: Path to text file containing URLs (one per line), or a list of URLs
         output_dir: Directory where videos will be saved
+        concurrency: Number of URLs downloaded in parallel
+        ydl_opts: yt-dlp options (default: best quality into output_dir)
     """
-    if not os.path.exists(urls_file):
-        print(f"Error: File '{urls_file}' not found")
+    urls = _as_url_list(urls)
+    if urls is None:
         return False
     
     Path(output_dir).mkdir(parents=True, exist_ok=True)
     
-    with open(urls_file, 'r') as f:
-        urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-    
     if not urls:
         print("No URLs found in the file")
         return False
@@ -36,29 +201,65 @@ def download_videos(urls_file, output_dir="downloads"):
     print(f"Saving to: {output_dir}/")
     print("-" * 50)
     
+    if ydl_opts is None:
+        ydl_opts = build_ydl_opts(output_dir)
+    
+    successful, failed = _download_all(urls, ydl_opts, concurrency)
+    
+    print("\n" + "=" * 50)
+    print(f"Download complete!")
+    print(f"  Successful: {successful}")
+    print(f"  Failed: {failed}")
+    
+    return True
+
+def remix_from_urls(urls, remix_dir="remixed", quality="best", concurrency=4):
+    """
+    Remix videos from URLs listed in a text file without downloading them first
+    
+    Args:
+        urls: Path to text file containing URLs (one per line), or a list of URLs
+        remix_dir: Directory where remixed videos will be saved
+        quality: Maximum video height, or 'best'
+        concurrency: Number of URLs remixed in parallel
+    """
+    from remix_videos import VideoRemixer
+    
+    urls = _as_url_list(urls)
+    if urls is None:
+        return False
+    
+    if not urls:
+        print("No URLs found in the file")
+        return False
+    
+    print(f"Found {len(urls)} URLs to remix")
+    print(f"Saving to: {remix_dir}/")
+    print("-" * 50)
+    
+    # Streaming needs a single progressive file rather than separate audio/video to merge
+    height = '' if quality == 'best' else f'[height<={quality}]'
     ydl_opts = {
-        'outtmpl': os.path.join(output_dir, '%(title)s-%(id)s.%(ext)s'),
+        'format': f'best{height}[ext=mp4]/best{height}/best',
         'quiet': False,
         'no_warnings': False,
         'ignoreerrors': True,
-        'continue': True,
     }
     
-    successful = 0
-    failed = 0
+    remixer = VideoRemixer(output_dir=remix_dir)
+    encoder = remixer._detect_hw_encoder()
+    print(f"Using encoder: {encoder}")
+    show_progress = concurrency == 1
+    # Split the CPUs between the parallel encodes, as remix_videos does for its jobs
+    threads = None if concurrency <= 1 else max(1, (os.cpu_count() or 1) // concurrency)
     
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        for i, url in enumerate(urls, 1):
-            print(f"\n[{i}/{len(urls)}] Downloading: {url}")
-            try:
-                ydl.download([url])
-                successful += 1
-            except Exception as e:
-                print(f"   Error: {str(e)}")
-                failed += 1
+    successful, failed = _download_all(
+        urls, ydl_opts, concurrency,
+        action=lambda url, ydl: download_and_remix(url, ydl, remixer, show_progress, threads),
+        buffer_output=concurrency > 1)
     
     print("\n" + "=" * 50)
-    print(f"Download complete!")
+    print(f"Remix complete!")
     print(f"  Successful: {successful}")
     print(f"  Failed: {failed}")
     
@@ -74,6 +275,9 @@ Example usage:
   python batch_download.py urls.txt -o my_videos
   python batch_download.py urls.txt --audio-only
   python batch_download.py urls.txt --quality 720
+  python batch_download.py urls.txt --concurrency 8
+  python batch_download.py urls.txt --remix
+  python batch_download.py urls.txt --remix -o remixed_videos --quality 720
 
 Text file format:
   - One URL per line
@@ -83,75 +287,37 @@ Text file format:
     )
     
     parser.add_argument('urls_file', help='Path to text file containing URLs')
-    parser.add_argument('-o', '--output', default='downloads', 
-                        help='Output directory (default: downloads)')
+    parser.add_argument('-o', '--output',
+                        help='Output directory (default: downloads, or remixed with --remix)')
     parser.add_argument('--audio-only', action='store_true',
                         help='Download audio only')
     parser.add_argument('--quality', type=str, default='best',
                         help='Video quality (e.g., 720, 1080, best)')
+    parser.add_argument('--concurrency', type=int, default=4,
+                        help='Number of parallel downloads (default: 4)')
+    parser.add_argument('--remix', action='store_true',
+                        help='Remix videos straight from the network into the output '
+                             'directory instead of saving the downloads')
     
     args = parser.parse_args()
     
+    if not os.path.exists(args.urls_file):
+        print(f"Error: File '{args.urls_file}' not found")
+        return
+    urls = _load_urls(args.urls_file)
+    
+    if args.remix:
+        if args.audio_only:
+            parser.error("--remix cannot be combined with --audio-only")
+        remix_from_urls(urls, args.output or 'remixed', args.quality, args.concurrency)
+        return
+    
     if args.audio_only:
         print("Note: Audio-only mode enabled")
-        ydl_opts = {
-            'outtmpl': os.path.join(args.output, '%(title)s-%(id)s.%(ext)s'),
-            'format': 'bestaudio/best',
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }],
-            'quiet': False,
-            'no_warnings': False,
-            'ignoreerrors': True,
-            'continue': True,
-        }
-    elif args.quality != 'best':
-        ydl_opts = {
-            'outtmpl': os.path.join(args.output, '%(title)s-%(id)s.%(ext)s'),
-            'format': f'best[height<={args.quality}]/best',
-            'quiet': False,
-            'no_warnings': False,
-            'ignoreerrors': True,
-            'continue': True,
-        }
-    else:
-        ydl_opts = None
-    
-    if ydl_opts:
-        Path(args.output).mkdir(parents=True, exist_ok=True)
-        
-        with open(args.urls_file, 'r') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        
-        if not urls:
-            print("No URLs found in the file")
-            return
-        
-        print(f"Found {len(urls)} URLs to download")
-        print(f"Saving to: {args.output}/")
-        print("-" * 50)
-        
-        successful = 0
-        failed = 0
-        
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            for i, url in enumerate(urls, 1):
-                print(f"\n[{i}/{len(urls)}] Downloading: {url}")
-                try:
-                    ydl.download([url])
-                    successful += 1
-                except Exception as e:
-                    print(f"   Error: {str(e)}")
-                    failed += 1
-        
-        print("\n" + "=" * 50)
-        print(f"Download complete!")
-        print(f"  Successful: {successful}")
-        print(f"  Failed: {failed}")
-    else:
-        download_videos(args.urls_file, args.output)
+    
+    output_dir = args.output or 'downloads'
+    ydl_opts = build_ydl_opts(output_dir, args.audio_only, args.quality)
+    download_videos(urls, output_dir, args.concurrency, ydl_opts)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
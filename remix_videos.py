@@ -1,301 +1,719 @@
 #!/usr/bin/env python3
 import os
 import random
-import string
 import subprocess
 import json
 from pathlib import Path
 import shutil
-from datetime import datetime
+from datetime import datetime, timezone
 import argparse
+import atexit
 import tempfile
+import io
+import contextlib
+import multiprocessing
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import orjson  # Optional: faster report serialization
+except ImportError:
+    orjson = None
+
+DEFAULT_THREADS_PER_JOB = 4
+
+# H.264 encoders in order of preference; libx264 is the CPU fallback
+H264_ENCODERS = ['h264_videotoolbox', 'h264_nvenc', 'h264_qsv', 'h264_amf', 'libx264']
+
+# Decoder hwaccel to pair with each hardware encoder
+HWACCELS = {'h264_videotoolbox': 'videotoolbox', 'h264_nvenc': 'cuda'}
+
+# Target bits per pixel per frame; ~2 Mbps at 720x1280@30, ~4.4 Mbps at 1080x1920@30
+BITS_PER_PIXEL = 0.07
+DEFAULT_BITRATE_KBPS = 2000
+MAXRATE_FACTOR = 150  # Hardware encoder peak bitrate, as a percentage of the target
+
+# All per-video metadata reports are appended here, one JSON object per line
+REPORTS_FILENAME = "metadata_reports.jsonl"
+
+# (name, low, high, decimals) for each continuously drawn random parameter
+PARAM_RANGES = (
+    # Basic Adjustments
+    ("zoom_factor", 1.02, 1.08, 2),
+    ("playback_speed", 0.92, 1.08, 2),
+    ("saturation", 0.92, 1.08, 2),
+    ("brightness", -0.08, 0.08, 2),
+    ("contrast", 0.92, 1.08, 2),
+    ("volume", 0.92, 1.08, 2),
+
+    # Algorithm Fingerprint - Color Adjustments
+    ("hue_shift", -5, 5, 1),
+    ("gamma", 0.95, 1.05, 2),
+    ("temperature", 0.95, 1.05, 2),
+
+    # Pixel Adjustments
+    ("noise", 0, 0.02, 2),
+    ("sharpness", 0.95, 1.05, 2),
+    ("blend", 0, 0.01, 2),
+
+    # Encoding Adjustments
+    ("bitrate_variation", 0.95, 1.05, 2),
+    ("frame_blending", 0, 0.25, 2),
+    ("time_shift", -5, 5, 1),
+)
+
+# Parameter values that leave the video untouched; filters for these are skipped
+NEUTRAL_VALUES = {
+    "zoom_factor": 1.0,
+    "brightness": 0,
+    "contrast": 1.0,
+    "saturation": 1.0,
+    "gamma": 1.0,
+    "hue_shift": 0,
+    "sharpness": 1.0,
+    "noise": 0,
+    "flip_horizontal": False,
+    "add_padding": 0,
+    "playback_speed": 1.0,
+    "volume": 1.0,
+}
+NEUTRAL_TOLERANCE = 1e-6
+
+# Audio codecs the MP4 muxer accepts as-is; anything else is re-encoded to AAC
+MP4_AUDIO_CODECS = {"aac", "mp3", "alac", "ac3", "eac3", "opus", "flac"}
+EQ_KEYS = ("brightness", "contrast", "saturation", "gamma")
+
+# FFmpeg filter templates, filled from the non-neutral parameters
+# Scaling back up truncates to odd sizes for most zooms, which yuv420p encoders reject.
+# The crop and scale ratios differ slightly per axis, so reset the SAR or players stretch it
+ZOOM_TPL = ("crop=iw/{zoom_factor}:ih/{zoom_factor},"
+            "scale=trunc(iw*{zoom_factor}/2)*2:trunc(ih*{zoom_factor}/2)*2:flags=bilinear,setsar=1")
+EQ_TPL = "eq={eq}"
+HUE_TPL = "hue=h={hue_shift}"
+UNSHARP_TPL = "unsharp=5:5:{unsharp}:5:5:0"
+SMARTBLUR_TPL = "smartblur=1.5:{smartblur}:0"
+NOISE_TPL = "noise=alls={alls}:allf=t"
+PAD_TPL = "pad=iw:ih+{pad_height}:0:{add_padding}:black"
+# Same filters with the frame size resolved from ffprobe
+ZOOM_FIXED_TPL = "crop={crop_width}:{crop_height},scale={width}:{height}:flags=bilinear,setsar=1"
+PAD_FIXED_TPL = "pad={width}:{padded_height}:0:{add_padding}:black"
+SETPTS_TPL = "setpts={pts}*PTS"
+VOLUME_TPL = "volume={volume}"
+ATEMPO_TPL = "atempo={playback_speed}"
+
+# Filter chains in application order: (value key, template, template once the
+# frame size is probed). A filter is emitted only when its key has a value
+VIDEO_FILTERS = (
+    ("zoom_factor", ZOOM_TPL, ZOOM_FIXED_TPL),
+    ("eq", EQ_TPL, EQ_TPL),
+    ("hue_shift", HUE_TPL, HUE_TPL),
+    ("unsharp", UNSHARP_TPL, UNSHARP_TPL),
+    ("smartblur", SMARTBLUR_TPL, SMARTBLUR_TPL),
+    ("noise", NOISE_TPL, NOISE_TPL),
+    ("flip_horizontal", "hflip", "hflip"),
+    ("add_padding", PAD_TPL, PAD_FIXED_TPL),
+    ("playback_speed", SETPTS_TPL, SETPTS_TPL),
+)
+AUDIO_FILTERS = (
+    ("volume", VOLUME_TPL),
+    ("playback_speed", ATEMPO_TPL),
+)
+
+# iPhone models from 12 to 17 series
+IPHONE_MODELS = (
+    "iPhone 12", "iPhone 12 mini", "iPhone 12 Pro", "iPhone 12 Pro Max",
+    "iPhone 13", "iPhone 13 mini", "iPhone 13 Pro", "iPhone 13 Pro Max",
+    "iPhone 14", "iPhone 14 Pro", "iPhone 14 Pro Max",
+    "iPhone 15", "iPhone 15 Pro", "iPhone 15 Pro Max",
+    "iPhone 16", "iPhone 16 Pro", "iPhone 16 Pro Max",
+    "iPhone 17", "iPhone 17 Pro", "iPhone 17 Pro Max",
+)
+IOS_VERSIONS = ("iOS 18.6.1", "iOS 18.4.1", "iOS 18.5")
+IPHONE_17_IOS_VERSION = "iOS 26.0.0"  # iPhone 17 models ship with iOS 26
+# Fake creation dates are drawn from 2021-01-01 to 2025-12-31
+CREATION_TIMESTAMP_RANGE = (1609459200, 1767225599)
+# ISO 8601, which FFmpeg parses into the mvhd/tkhd creation time (exiftool's "2025:01:31 ..." it can't)
+CREATION_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Per-process output counter; module level so every pool task in a worker shares it
+_output_counter = itertools.count(1)
+
+# Parameter RNG; a private instance so other users of the random module don't shift its draws
+_rng = random.Random()
+
+def _init_worker(worker_counter=None, threads=None):
+    """Reseed the RNG and, where supported, pin the worker to its own CPUs"""
+    # Forked workers would otherwise draw identical parameters
+    _rng.seed()
+    
+    # Disjoint CPU sets keep each encoder's caches warm; ffmpeg inherits the affinity.
+    # Not available on macOS/Windows, where -threads alone bounds each job
+    if worker_counter is None or not hasattr(os, "sched_setaffinity"):
+        return
+    with worker_counter.get_lock():
+        index = worker_counter.value
+        worker_counter.value += 1
+    cpus = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, cpus[index * threads:(index + 1) * threads])
+
+def _process_one(remixer, video_file, threads, params=None, original_exif=None):
+    """Process a single video inside a pool worker; returns (success, output_path, log)"""
+    # Buffer the worker's output so the parent prints each video's log in one piece
+    # instead of interleaving lines from every job
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        success, output_path = remixer.process_video(video_file, params=params, threads=threads,
+                                                     show_progress=False, original_exif=original_exif)
+    return success, output_path, log.getvalue()
+
+def _prefetch_metadata(paths, span=1 << 20):
+    """Ask the kernel to read ahead the head and tail of each file, where MP4 keeps its moov atom"""
+    # Not available on macOS/Windows; the hint is asynchronous, so this returns immediately
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            size = os.fstat(fd).st_size
+            os.posix_fadvise(fd, 0, min(span, size), os.POSIX_FADV_WILLNEED)
+            if size > span:
+                os.posix_fadvise(fd, max(span, size - span), 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+def _run_capture(cmd):
+    """Run a command and collect its stdout as bytes; returns (returncode, stdout)"""
+    # Read in large chunks and join once, discarding stderr, instead of
+    # buffering and decoding both streams like capture_output=True
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                          stdin=subprocess.DEVNULL) as proc:
+        chunks = []
+        while chunk := proc.stdout.read(65536):
+            chunks.append(chunk)
+        return proc.wait(), b"".join(chunks)
+
+class ExifTool:
+    """Long-running exiftool (-stay_open) so each call skips the Perl startup cost"""
+    SENTINEL = b"{ready}"
+    
+    def __init__(self):
+        self._proc = None
+        self._pid = None
+    
+    def execute(self, *args):
+        """Run one exiftool command and return its stdout as bytes
+        
+        Arguments go through exiftool's -@ argfile, one per line, so callers must
+        pass absolute paths: relative names starting with '#' read as comments.
+        """
+        if any("\n" in arg or "\r" in arg for arg in args):
+            raise ValueError("exiftool arguments can't contain newlines")
+        
+        # A forked pool worker must not share the parent's pipes, so start its own
+        if self._proc is None or self._proc.poll() is not None or self._pid != os.getpid():
+            self._proc = subprocess.Popen(
+                ["exiftool", "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            self._pid = os.getpid()
+        
+        self._proc.stdin.write(b"\n".join(os.fsencode(arg) for arg in args) + b"\n-execute\n")
+        self._proc.stdin.flush()
+        
+        # Read until exiftool prints {ready} after this command's output
+        fd = self._proc.stdout.fileno()
+        chunks = []
+        tail = b""
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise RuntimeError("exiftool exited unexpectedly")
+            chunks.append(chunk)
+            tail = (tail + chunk)[-32:]
+            if tail.rstrip().endswith(self.SENTINEL):
+                break
+        return b"".join(chunks).rstrip()[:-len(self.SENTINEL)]
+    
+    def close(self):
+        """Ask exiftool to exit"""
+        if self._proc is not None and self._pid == os.getpid() and self._proc.poll() is None:
+            self._proc.stdin.write(b"-stay_open\nFalse\n")
+            self._proc.stdin.flush()
+            self._proc.wait()
+        self._proc = None
+
+# One exiftool per process, created on first use
+_exiftool = ExifTool()
+atexit.register(_exiftool.close)
 
 class VideoRemixer:
-    def __init__(self, input_dir="downloads", output_dir="remixed", remove_audio=False):
+    # Constant parts of every FFmpeg command, built once
+    FFMPEG_BASE_ARGS = ("ffmpeg", "-nostdin", "-hide_banner", "-nostats", "-loglevel", "error",
+                        "-progress", "pipe:1")
+    # Drop the source's metadata, chapters and timecode track, then write the fake
+    # tags in the same pass instead of rewriting the file with exiftool afterwards.
+    # The encoder tag can't be faked here: the muxer always writes its own Lavf version
+    METADATA_ARGS = (
+        "-map_metadata", "-1",
+        "-map_chapters", "-1",
+        "-write_tmcd", "0",
+        "-metadata", "make=Apple",
+        "-metadata", "handler_type=Metadata Tags",
+    )
+    AUDIO_ENCODE_ARGS = ("-c:a", "aac", "-b:a", "128k")
+    OUTPUT_ARGS = ("-movflags", "+faststart+use_metadata_tags")
+    
+    def __init__(self, input_dir="downloads", output_dir="remixed", remove_audio=False,
+                 jobs=None, threads_per_job=None, encoder=None, report=False):
         self.input_dir = Path(input_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.remove_audio = remove_audio
+        self.jobs = jobs
+        self.threads_per_job = threads_per_job
+        self.encoder = encoder  # None means detect on first use
+        self.report = report  # Write metadata_reports.jsonl entries (needs exiftool)
+        # Output names share one timestamp per run; process ID and counter keep them unique
+        self.run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._probe_cache = {}
         
     def get_random_parameters(self):
         """Generate random parameters"""
-        # iPhone models from 12 to 17 series
-        iphone_models = [
-            "iPhone 12", "iPhone 12 mini", "iPhone 12 Pro", "iPhone 12 Pro Max",
-            "iPhone 13", "iPhone 13 mini", "iPhone 13 Pro", "iPhone 13 Pro Max",
-            "iPhone 14", "iPhone 14 Pro", "iPhone 14 Pro Max",
-            "iPhone 15", "iPhone 15 Pro", "iPhone 15 Pro Max",
-            "iPhone 16", "iPhone 16 Pro", "iPhone 16 Pro Max",
-            "iPhone 17", "iPhone 17 Pro", "iPhone 17 Pro Max"
-        ]
-
-        params = {
-            # Basic Adjustments
-            "zoom_factor": round(random.uniform(1.02, 1.08), 2),
-            "playback_speed": round(random.uniform(0.92, 1.08), 2),
-            "saturation": round(random.uniform(0.92, 1.08), 2),
-            "brightness": round(random.uniform(-0.08, 0.08), 2),
-            "contrast": round(random.uniform(0.92, 1.08), 2),
-            "volume": round(random.uniform(0.92, 1.08), 2),
-
-            # Algorithm Fingerprint - Color Adjustments
-            "hue_shift": round(random.uniform(-5, 5), 1),
-            "gamma": round(random.uniform(0.95, 1.05), 2),
-            "temperature": round(random.uniform(0.95, 1.05), 2),
-
-            # Pixel Adjustments
-            "noise": round(random.uniform(0, 0.02), 2),
-            "sharpness": round(random.uniform(0.95, 1.05), 2),
-            "blend": round(random.uniform(0, 0.01), 2),
-
-            # Encoding Adjustments
-            "bitrate_variation": round(random.uniform(0.95, 1.05), 2),
-            "frame_blending": round(random.uniform(0, 0.25), 2),
-            "time_shift": round(random.uniform(-5, 5), 1),
-
+        uniform, chance, choice = _rng.uniform, _rng.random, _rng.choice
+        iphone_model = choice(IPHONE_MODELS)
+        creation_dt = datetime.fromtimestamp(_rng.randint(*CREATION_TIMESTAMP_RANGE), timezone.utc)
+        params = {name: round(uniform(low, high), digits) for name, low, high, digits in PARAM_RANGES}
+        params.update({
             # Additional transformations
             "remove_audio": self.remove_audio,  # Use class setting
-            "flip_horizontal": random.choice([True, False]) if random.random() < 0.1 else False,
-            "add_padding": random.choice([2, 4, 6, 8]) if random.random() < 0.3 else 0,
+            "flip_horizontal": choice((True, False)) if chance() < 0.1 else False,
+            "add_padding": choice((2, 4, 6, 8)) if chance() < 0.3 else 0,
+
+            # Encoder quality (CRF, or the equivalent constant-quality level)
+            "crf": _rng.randint(20, 24),
 
             # Fake iPhone metadata
-            "iphone_model": random.choice(iphone_models),
-        }
+            "iphone_model": iphone_model,
+            "iphone_software": IPHONE_17_IOS_VERSION if "iPhone 17" in iphone_model else choice(IOS_VERSIONS),
+            "creation_time": creation_dt.strftime(CREATION_TIME_FORMAT),
+        })
         return params
     
-    def build_ffmpeg_filters(self, params):
-        """Build FFmpeg filter string from parameters"""
-        filters = []
-        
-        # Zoom (crop and scale)
-        if params["zoom_factor"] != 1.0:
-            filters.append(f"scale=iw*{params['zoom_factor']}:ih*{params['zoom_factor']},crop=iw/{params['zoom_factor']}:ih/{params['zoom_factor']}")
-        
-        # Color adjustments
-        eq_parts = []
-        if params["brightness"] != 0:
-            eq_parts.append(f"brightness={params['brightness']}")
-        if params["contrast"] != 1.0:
-            eq_parts.append(f"contrast={params['contrast']}")
-        if params["saturation"] != 1.0:
-            eq_parts.append(f"saturation={params['saturation']}")
-        if params["gamma"] != 1.0:
-            eq_parts.append(f"gamma={params['gamma']}")
+    def _active_params(self, params):
+        """Return only the filter parameters that differ from their neutral value"""
+        # Compare with a tolerance so float noise can't turn on a filter that does nothing
+        return {key: params[key] for key, neutral in NEUTRAL_VALUES.items()
+                if abs(params[key] - neutral) > NEUTRAL_TOLERANCE}
+    
+    def _filter_values(self, params, probe=None):
+        """Collect the non-neutral parameters and every derived filter value once"""
+        values = self._active_params(params)
         
+        eq_parts = [f"{key}={values[key]}" for key in EQ_KEYS if key in values]
         if eq_parts:
-            filters.append(f"eq={':'.join(eq_parts)}")
-        
-        # Hue shift
-        if params["hue_shift"] != 0:
-            filters.append(f"hue=h={params['hue_shift']}")
-        
-        # Sharpness
-        if params["sharpness"] != 1.0:
-            unsharp_val = params["sharpness"] - 1.0
-            if unsharp_val > 0:
-                filters.append(f"unsharp=5:5:{unsharp_val}:5:5:0")
-            else:
-                filters.append(f"smartblur=1.5:{abs(unsharp_val)}:0")
-        
-        # Noise
-        if params["noise"] > 0:
-            filters.append(f"noise=alls={int(params['noise']*100)}:allf=t")
+            values["eq"] = ":".join(eq_parts)
+        if "sharpness" in values:
+            # Sharpen above 1.0, soften below it
+            sharpen = "unsharp" if values["sharpness"] > 1.0 else "smartblur"
+            values[sharpen] = round(abs(values["sharpness"] - 1.0), 2)
+        if "noise" in values:
+            values["alls"] = int(values["noise"] * 100)
+            if values["alls"] < 1:
+                # Strength truncates to 0, so the filter would only burn per-frame PRNG work
+                del values["noise"]
+        if "add_padding" in values:
+            values["pad_height"] = values["add_padding"] * 2
+        if "playback_speed" in values:
+            values["pts"] = 1.0 / values["playback_speed"]
+        
+        # With a probe result, resolve the frame size to pixels
+        if probe:
+            width, height = probe["width"], probe["height"]
+            if "zoom_factor" in values:
+                crop_width = int(width / values["zoom_factor"]) // 2 * 2
+                crop_height = int(height / values["zoom_factor"]) // 2 * 2
+                if width - crop_width >= 2 or height - crop_height >= 2:
+                    # Scale back to even dimensions, which every H.264 encoder accepts
+                    width, height = width // 2 * 2, height // 2 * 2
+                    values["crop_width"], values["crop_height"] = crop_width, crop_height
+                else:
+                    del values["zoom_factor"]
+            values["width"], values["height"] = width, height
+            values["padded_height"] = height + values.get("pad_height", 0)
+        
+        return values
+    
+    def build_ffmpeg_filters(self, params, probe=None):
+        """Build FFmpeg filter string from parameters
         
-        # Flip horizontal
-        if params["flip_horizontal"]:
-            filters.append("hflip")
+        With a probe result the frame size is written out in pixels instead of
+        iw/ih expressions, and zooms too small to move a pixel are skipped.
+        """
+        values = self._filter_values(params, probe)
+        sized = "width" in values
         
-        # Add padding (letterbox effect)
-        if params["add_padding"] > 0:
-            pad = params["add_padding"]
-            filters.append(f"pad=iw:ih+{pad*2}:0:{pad}:black")
+        # Zoom crops the centre before scaling back up, so the scaler only reads
+        # the 1/z² of the frame that survives instead of upscaling it all
+        filters = [(fixed if sized else template).format_map(values)
+                   for key, template, fixed in VIDEO_FILTERS if key in values]
         
-        # Speed adjustment (requires setpts filter)
-        if params["playback_speed"] != 1.0:
-            pts_value = 1.0 / params["playback_speed"]
-            filters.append(f"setpts={pts_value}*PTS")
+        if not filters:
+            return None
         
-        return ",".join(filters) if filters else None
+        # Pin the pixel format once at the end rather than letting each encoder negotiate it
+        filters.append("format=yuv420p")
+        return ",".join(filters)
     
     def build_audio_filters(self, params):
         """Build FFmpeg audio filter string"""
-        audio_filters = []
-        
-        # Volume adjustment
-        if params["volume"] != 1.0:
-            audio_filters.append(f"volume={params['volume']}")
-        
-        # Audio speed adjustment (to match video speed)
-        if params["playback_speed"] != 1.0:
-            audio_filters.append(f"atempo={params['playback_speed']}")
+        values = self._active_params(params)
+        audio_filters = [template.format_map(values) for key, template in AUDIO_FILTERS if key in values]
         
         return ",".join(audio_filters) if audio_filters else None
     
-    def get_exif_data(self, video_path):
-        """Extract all EXIF metadata from video"""
+    def _probe(self, video_path):
+        """Read frame size, frame rate, duration and audio codec with ffprobe (cached per file version)
+        
+        Returns False when ffprobe ran and found no usable video stream, and None
+        when the file couldn't be probed at all (e.g. ffprobe isn't installed).
+        """
+        video_path = str(video_path)
+        try:
+            # Key on mtime too, so a file replaced between runs of a long-lived remixer is re-probed
+            cache_key = (video_path, os.stat(video_path).st_mtime_ns)
+        except OSError:
+            return False
+        if cache_key in self._probe_cache:
+            return self._probe_cache[cache_key]
+        
+        probe = None
         try:
             cmd = [
-                "exiftool",
+                "ffprobe", "-v", "error",
+                "-print_format", "json",
+                "-show_streams", "-show_format",
+                video_path
+            ]
+            returncode, output = _run_capture(cmd)
+            probe = False
+            if returncode == 0:
+                info = json.loads(output)
+                video = next((stream for stream in info.get("streams", [])
+                              if stream.get("codec_type") == "video"), None)
+                if video and video.get("width") and video.get("height"):
+                    width, height = video["width"], video["height"]
+                    # Filters see the frame after autorotation, so swap for portrait rotations
+                    rotation = int(float(video.get("tags", {}).get("rotate", 0)))
+                    for side_data in video.get("side_data_list", []):
+                        rotation = int(side_data.get("rotation", rotation))
+                    if rotation % 180:
+                        width, height = height, width
+                    
+                    num, _, den = video.get("avg_frame_rate", "0/0").partition("/")
+                    fps = float(num) / float(den) if den and float(den) else None
+                    duration = video.get("duration") or info.get("format", {}).get("duration")
+                    audio = next((stream for stream in info.get("streams", [])
+                                  if stream.get("codec_type") == "audio"), None)
+                    probe = {
+                        "width": width,
+                        "height": height,
+                        "fps": fps,
+                        "duration": float(duration) if duration else None,
+                        "has_audio": audio is not None,
+                        "audio_codec": audio.get("codec_name") if audio else None,
+                    }
+        except Exception as e:
+            # Includes a missing ffprobe binary; callers fall back to unprobed filters
+            print(f"  ⚠ Could not probe video: {str(e)}")
+            probe = None
+        
+        self._probe_cache[cache_key] = probe
+        return probe
+    
+    def _target_bitrate(self, params, probe=None):
+        """Pick a video bitrate from the frame size and rate, with random variation"""
+        bitrate_kbps = DEFAULT_BITRATE_KBPS
+        if probe and probe["fps"]:
+            bitrate_kbps = probe["width"] * probe["height"] * probe["fps"] * BITS_PER_PIXEL / 1000
+        return f"{int(bitrate_kbps * params['bitrate_variation'])}k"
+    
+    def _encoder_works(self, encoder):
+        """Check that an encoder can actually open on this machine"""
+        cmd = [
+            "ffmpeg", "-hide_banner", "-loglevel", "error",
+            "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+            "-frames:v", "1", "-c:v", encoder, "-f", "null", "-"
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0
+    
+    def _detect_hw_encoder(self):
+        """Pick the first available H.264 encoder, preferring hardware ones"""
+        if self.encoder is None:
+            self.encoder = "libx264"
+            try:
+                _, output = _run_capture(["ffmpeg", "-hide_banner", "-encoders"])
+                available = set(output.decode(errors="replace").split())
+                for encoder in H264_ENCODERS[:-1]:
+                    # Builds list encoders even without the hardware, so test-encode a frame
+                    if encoder in available and self._encoder_works(encoder):
+                        self.encoder = encoder
+                        break
+            except Exception as e:
+                print(f"  ⚠ Could not detect hardware encoders: {str(e)}")
+        return self.encoder
+    
+    def build_encoder_args(self, encoder, quality, bitrate):
+        """Build video encoder arguments for the selected encoder"""
+        # Cap peaks on the bitrate-driven hardware encoders, which otherwise overshoot on busy scenes
+        maxrate = f"{int(bitrate.rstrip('k')) * MAXRATE_FACTOR // 100}k"
+        if encoder == "h264_nvenc":
+            return ["-c:v", encoder, "-preset", "p4", "-rc", "vbr", "-cq", str(quality),
+                    "-b:v", bitrate, "-maxrate", maxrate]
+        if encoder == "h264_videotoolbox":
+            # VideoToolbox has no CRF equivalent on all Macs, so it is bitrate driven
+            return ["-c:v", encoder, "-b:v", bitrate, "-maxrate", maxrate, "-allow_sw", "1"]
+        if encoder == "h264_qsv":
+            return ["-c:v", encoder, "-preset", "medium", "-global_quality", str(quality)]
+        if encoder == "h264_amf":
+            return ["-c:v", encoder, "-quality", "balanced", "-rc", "cqp",
+                    "-qp_i", str(quality), "-qp_p", str(quality)]
+        return ["-c:v", encoder, "-preset", "medium", "-crf", str(quality), "-b:v", bitrate]
+    
+    def run_ffmpeg(self, cmd, show_progress=True, on_start=None):
+        """Run FFmpeg, streaming -progress output; returns (returncode, stderr)
+        
+        on_start is called once FFmpeg is running, to overlap other work with the encode.
+        """
+        # stderr goes to a temp file so a chatty failure can't block the pipe,
+        # and is only read back when the encode fails
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                    stdin=subprocess.DEVNULL)
+            if on_start:
+                # Progress lines are tiny, so the pipe won't fill while this runs
+                on_start()
+            for line in proc.stdout:
+                if show_progress and line.startswith(b"out_time_ms="):
+                    value = line[len(b"out_time_ms="):].strip()
+                    if value.isdigit():
+                        print(f"\r  Encoded: {int(value) / 1_000_000:.1f}s", end="", flush=True)
+            returncode = proc.wait()
+            if show_progress:
+                print()
+            if returncode == 0:
+                return returncode, ""
+            stderr_file.seek(0)
+            return returncode, stderr_file.read().decode(errors="replace")
+    
+    def get_exif_data(self, video_path, fast=1):
+        """Extract all EXIF metadata from video
+        
+        fast=1 skips trailer scans; fast=2 also skips MakerNotes and stops at the
+        mdat atom, so only use it on files whose moov comes first (+faststart).
+        """
+        return next(iter(self.get_exif_batch([video_path], fast).values()), {})
+    
+    def get_exif_batch(self, video_paths, fast=1):
+        """Extract EXIF metadata for several videos in one exiftool request; returns {path: metadata}"""
+        # Absolute paths, so argfile lines can't be read as comments (#fyp.mp4) or options
+        paths = {}
+        for video_path in video_paths:
+            if "\n" in str(video_path) or "\r" in str(video_path):
+                print(f"  ⚠ Could not extract EXIF data: newline in file name {str(video_path)!r}")
+                continue
+            paths[os.path.normpath(os.path.abspath(video_path))] = str(video_path)
+        if not paths:
+            return {}
+        
+        try:
+            output = _exiftool.execute(
+                f"-fast{fast}",
                 "-j",  # JSON output
                 "-a",  # Allow duplicate tags
                 "-G",  # Show group names
-                str(video_path)
-            ]
+                *paths
+            )
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                metadata = json.loads(result.stdout)[0] if result.stdout else {}
+            results = {}
+            for metadata in (json.loads(output) if output.strip() else []):
+                # exiftool reports paths with forward slashes, so normalize them to map back
+                source = os.path.normpath(metadata.get("SourceFile", ""))
                 # Remove file system metadata that changes naturally
                 keys_to_remove = ['SourceFile', 'FileName', 'Directory', 'FileModifyDate', 
                                  'FileAccessDate', 'FileInodeChangeDate', 'FilePermissions']
                 for key in keys_to_remove:
                     metadata.pop(key, None)
-                return metadata
-            return {}
+                results[paths.get(source, source)] = metadata
+            return results
         except Exception as e:
             print(f"  ⚠ Could not extract EXIF data: {str(e)}")
             return {}
     
-    def add_fake_metadata(self, video_path, params):
-        """Add fake iPhone metadata to video using exiftool"""
-        try:
-            # Randomize iPhone creation time and date original
-            random_dt = datetime.fromtimestamp(random.randint(1609459200, 1767225599))  # 2021-01-01 to 2025-12-31
-            iphone_creation_time = random_dt.strftime("%Y:%m:%d %H:%M:%S+00:00Z")
-            iphone_date_original = random_dt.strftime("%Y:%m:%d %H:%M:%S")
-            if params['iphone_model'].contains('iPhone 17'):
-                iphone_software = "iOS 26.0.0"
-            else:
-                iphone_software = ["iOS 18.6.1", "iOS 18.4.1", "iOS 18.5"].random()
-
-            exif_cmd = [
-                "exiftool",
-                "-overwrite_original",
-                f"-CreationTime={iphone_creation_time}",
-                f"-DateTimeOriginal={iphone_date_original}",
-                f"-CreateDate={iphone_creation_time}",
-                "-Make=Apple",
-                f"-Model={params['iphone_model']}",
-                f"-Software={iphone_software}",
-                "-Encoder=Lavf61.7.100",
-                "-HandlerType=Metadata Tags",
-                str(video_path)
-            ]
-
-            result = subprocess.run(exif_cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                print(f"  ✓ Fake iPhone metadata added with exiftool")
-                return True
-            else:
-                print(f"  ⚠ Warning: Could not add metadata with exiftool: {result.stderr}")
-                return False
-        except Exception as e:
-            print(f"  ⚠ Warning: exiftool not available or error: {str(e)}")
-            return False
-    
     def compare_metadata(self, original_meta, remixed_meta):
         """Compare metadata and return differences"""
+        original_keys, remixed_keys = original_meta.keys(), remixed_meta.keys()
+        
+        # Walk the dicts rather than the set differences so the report keeps exiftool's tag order
+        removed = {key: value for key, value in original_meta.items() if key not in remixed_keys}
+        added = {key: value for key, value in remixed_meta.items() if key not in original_keys}
+        modified = {
+            key: {'original': value, 'remixed': remixed_meta[key]}
+            for key, value in original_meta.items()
+            if key in remixed_keys and value != remixed_meta[key]
+        }
+        
         diff = {
-            'removed': {},
-            'modified': {},
-            'added': {},
+            'removed': removed,
+            'modified': modified,
+            'added': added,
             'summary': {
                 'original_keys': len(original_meta),
                 'remixed_keys': len(remixed_meta),
-                'removed_count': 0,
-                'modified_count': 0,
-                'added_count': 0
+                'removed_count': len(removed),
+                'modified_count': len(modified),
+                'added_count': len(added)
             }
         }
         
-        # Find removed keys
-        for key in original_meta:
-            if key not in remixed_meta:
-                diff['removed'][key] = original_meta[key]
-                diff['summary']['removed_count'] += 1
-        
-        # Find modified keys
-        for key in original_meta:
-            if key in remixed_meta and original_meta[key] != remixed_meta[key]:
-                diff['modified'][key] = {
-                    'original': original_meta[key],
-                    'remixed': remixed_meta[key]
-                }
-                diff['summary']['modified_count'] += 1
-        
-        # Find added keys
-        for key in remixed_meta:
-            if key not in original_meta:
-                diff['added'][key] = remixed_meta[key]
-                diff['summary']['added_count'] += 1
-        
         return diff
     
-    def process_video(self, input_path, params=None):
-        """Process a single video with FFmpeg and strip metadata"""
+    def append_report(self, report):
+        """Append a report as one JSON line to the shared reports file"""
+        # A single O_APPEND write keeps lines from parallel workers whole
+        if orjson:
+            line = orjson.dumps(report, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        else:
+            line = (json.dumps(report) + "\n").encode()
+        fd = os.open(self.output_dir / REPORTS_FILENAME, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+    
+    def write_report(self, original_exif, output_path, params, input_name):
+        """Compare metadata before and after a remix and append it to the reports file"""
+        # Get final EXIF data; FFmpeg wrote all metadata in the single pass
+        print(f"  Capturing remixed metadata...")
+        final_exif = self.get_exif_data(output_path, fast=2)
+        
+        # Compare metadata
+        metadata_diff = self.compare_metadata(original_exif, final_exif)
+        
+        # Create comprehensive metadata report
+        metadata_report = {
+            'original_exif': original_exif,
+            'final_exif': final_exif,
+            'differences': metadata_diff,
+            'processing_params': params,
+            'files': {
+                'input': input_name,
+                'output': str(output_path)
+            },
+            'timestamp': datetime.now().isoformat()
+        }
+        
+        # Save comprehensive metadata report
+        self.append_report(metadata_report)
+        
+        # Print summary
+        print(f"\n  Metadata Summary:")
+        print(f"    Original metadata fields: {metadata_diff['summary']['original_keys']}")
+        print(f"    Final metadata fields: {metadata_diff['summary']['remixed_keys']}")
+        print(f"    Removed fields: {metadata_diff['summary']['removed_count']}")
+        print(f"    Modified fields: {metadata_diff['summary']['modified_count']}")
+        print(f"    Added fields: {metadata_diff['summary']['added_count']}")
+
+        if metadata_diff['added']:
+            print(f"\n  Key fake iPhone metadata added:")
+            for key in list(metadata_diff['added'].keys())[:10]:  # Show first 10
+                print(f"    + {key}: {metadata_diff['added'][key]}")
+            if len(metadata_diff['added']) > 10:
+                print(f"    ... and {len(metadata_diff['added']) - 10} more fields")
+        
+        print(f"\n  ✓ Metadata report saved to: {REPORTS_FILENAME}")
+    
+    def process_video(self, input_path, params=None, threads=None, show_progress=True,
+                      input_args=None, name=None, original_exif=None):
+        """Process a single video with FFmpeg and strip metadata
+        
+        input_path may also be an http(s) URL, which FFmpeg reads directly;
+        input_args are extra FFmpeg input options (e.g. HTTP headers) and name
+        is used in place of the path in output and reports. original_exif, if
+        already read for a batch, saves the per-video exiftool read when reporting.
+        """
         if params is None:
             params = self.get_random_parameters()
+        threads = threads or self.threads_per_job
         
-        input_file = Path(input_path)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-        output_filename = f"remix_{timestamp}_{random_suffix}.mp4"
+        input_file = str(input_path)
+        is_stream = "://" in input_file
+        name = name or (input_file if is_stream else Path(input_file).name)
+        output_filename = f"remix_{self.run_timestamp}_{os.getpid()}_{next(_output_counter):05d}.mp4"
         output_path = self.output_dir / output_filename
         
-        # Capture original EXIF data before processing
-        print(f"\nCapturing original metadata...")
-        original_exif = self.get_exif_data(input_file)
+        # Skip files ffprobe rejected before paying for FFmpeg and encoder startup
+        probe = None if is_stream else self._probe(input_file)
+        if probe is False or (probe and probe["duration"] is not None and probe["duration"] <= 0):
+            print(f"✗ Skipping {name}: no readable video stream")
+            return False, None
+        
+        # A stream without filters has nothing to re-encode, only metadata to rewrite
+        video_filters = self.build_ffmpeg_filters(params, probe)
+        # Inputs without an audio track get no audio filters or encoder settings
+        drop_audio = params["remove_audio"] or (bool(probe) and not probe["has_audio"])
+        audio_filters = None if drop_audio else self.build_audio_filters(params)
+        encoder = self._detect_hw_encoder() if video_filters else "copy"
         
         # Build FFmpeg command with fake iPhone metadata
-        cmd = ["ffmpeg", "-i", str(input_file), "-y"]
+        cmd = list(self.FFMPEG_BASE_ARGS)
+        if encoder not in ("libx264", "copy"):
+            # Decode on the same device that encodes. Frames still come back to system
+            # memory because eq/hue/unsharp/noise have no GPU variants in stock FFmpeg
+            cmd.extend(["-hwaccel", HWACCELS.get(encoder, "auto")])
+        cmd.extend(input_args or [])
+        cmd.extend(["-i", input_file, "-y"])
+        if threads:
+            cmd.extend(["-threads", str(threads)])
 
         # Add fake iPhone metadata
-        iphone_creation_time = "2025:09:30 22:48:55+00:00Z"
-        iphone_date_original = "2025:09:30 22:48:55"
-
+        cmd.extend(self.METADATA_ARGS)
         cmd.extend([
-            "-metadata", f"creation_time={iphone_creation_time}",
-            "-metadata", f"date={iphone_date_original}",
-            "-metadata", "make=Apple",
+            "-metadata", f"creation_time={params['creation_time']}",
+            "-metadata", f"date={params['creation_time']}",
             "-metadata", f"model={params['iphone_model']}",
-            "-metadata", "software=iOS 18.2.1",
-            "-metadata", "encoder=Lavf61.7.100",
-            "-metadata", "handler_type=Metadata Tags",
+            "-metadata", f"software={params['iphone_software']}",
         ])
         
-        # Add video filters
-        video_filters = self.build_ffmpeg_filters(params)
+        # Add video filters, or copy the video stream untouched
         if video_filters:
             cmd.extend(["-vf", video_filters])
+            # Encoding parameters with bitrate variation
+            base_bitrate = self._target_bitrate(params, probe)
+            cmd.extend(self.build_encoder_args(encoder, params["crf"], base_bitrate))
+        else:
+            cmd.extend(["-c:v", "copy"])
         
-        # Add audio filters or remove audio
-        if params["remove_audio"]:
+        # Add audio filters, remove audio, or copy it untouched
+        if drop_audio:
             cmd.append("-an")
-        else:
-            audio_filters = self.build_audio_filters(params)
+        elif audio_filters or not (probe and probe["audio_codec"] in MP4_AUDIO_CODECS):
             if audio_filters:
                 cmd.extend(["-af", audio_filters])
+            cmd.extend(self.AUDIO_ENCODE_ARGS)
+        else:
+            cmd.extend(["-c:a", "copy"])
         
-        # Encoding parameters with bitrate variation
-        base_bitrate = "2M"
-        if params["bitrate_variation"] != 1.0:
-            # Adjust bitrate
-            bitrate_value = int(2000 * params["bitrate_variation"])
-            base_bitrate = f"{bitrate_value}k"
+        cmd.extend(self.OUTPUT_ARGS)
+        cmd.append(str(output_path))
         
-        cmd.extend([
-            "-c:v", "libx264",
-            "-preset", "medium",
-            "-crf", str(random.randint(20, 24)),
-            "-b:v", base_bitrate,
-            "-c:a", "aac",
-            "-b:a", "128k",
-            "-movflags", "+faststart",
-            str(output_path)
-        ])
-        
-        print(f"\nProcessing: {input_file.name}")
+        print(f"\nProcessing: {name}")
         print(f"Output: {output_filename}")
+        print(f"Encoder: {encoder}")
         print("\nApplied parameters:")
         for key, value in params.items():
             if value != 1.0 and value != 0 and value is not False:
@@ -304,66 +722,31 @@ class VideoRemixer:
         print(f"\nFake iPhone metadata to be added:")
         print(f"  Make: Apple")
         print(f"  Model: {params['iphone_model']}")
-        print(f"  Software: iOS 18.2.1")
-        print(f"  Creation Time: 2025:09:30 22:48:55+00:00Z")
+        print(f"  Software: {params['iphone_software']}")
+        print(f"  Creation Time: {params['creation_time']}")
 
+        # Capture original EXIF data while FFmpeg encodes (exiftool needs a local file);
+        # both only read the input, and exiftool's reads warm the page cache for FFmpeg
+        capture_original = None
+        if original_exif is None:
+            original_exif = {}
+            if self.report and not is_stream:
+                def capture_original():
+                    print(f"\nCapturing original metadata...")
+                    original_exif.update(self.get_exif_data(input_file))
+        
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
+            returncode, stderr = self.run_ffmpeg(cmd, show_progress, on_start=capture_original)
+            if returncode == 0:
                 print(f"✓ Successfully processed: {output_filename}")
                 
-                # Get EXIF data after initial FFmpeg processing
-                intermediate_exif = self.get_exif_data(output_path)
-
-                # Add fake iPhone metadata with exiftool as a second pass
-                self.add_fake_metadata(output_path, params)
-
-                # Get final EXIF data after adding metadata
-                print(f"  Capturing remixed metadata...")
-                final_exif = self.get_exif_data(output_path)
-                
-                # Compare metadata
-                metadata_diff = self.compare_metadata(original_exif, final_exif)
-                
-                # Create comprehensive metadata report
-                metadata_report = {
-                    'original_exif': original_exif,
-                    'intermediate_exif': intermediate_exif,  # After FFmpeg
-                    'final_exif': final_exif,  # After exiftool stripping
-                    'differences': metadata_diff,
-                    'processing_params': params,
-                    'files': {
-                        'input': str(input_file),
-                        'output': str(output_path)
-                    },
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                # Save comprehensive metadata report
-                report_file = self.output_dir / f"{output_filename}_metadata_report.json"
-                with open(report_file, 'w') as f:
-                    json.dump(metadata_report, f, indent=2)
-                
-                # Print summary
-                print(f"\n  Metadata Summary:")
-                print(f"    Original metadata fields: {metadata_diff['summary']['original_keys']}")
-                print(f"    Final metadata fields: {metadata_diff['summary']['remixed_keys']}")
-                print(f"    Removed fields: {metadata_diff['summary']['removed_count']}")
-                print(f"    Modified fields: {metadata_diff['summary']['modified_count']}")
-                print(f"    Added fields: {metadata_diff['summary']['added_count']}")
-
-                if metadata_diff['added']:
-                    print(f"\n  Key fake iPhone metadata added:")
-                    for key in list(metadata_diff['added'].keys())[:10]:  # Show first 10
-                        print(f"    + {key}: {metadata_diff['added'][key]}")
-                    if len(metadata_diff['added']) > 10:
-                        print(f"    ... and {len(metadata_diff['added']) - 10} more fields")
-                
-                print(f"\n  ✓ Metadata report saved: {report_file.name}")
+                if self.report:
+                    self.write_report(original_exif, output_path, params,
+                                      name if is_stream else input_file)
                 
                 return True, output_path
             else:
-                print(f"✗ Error processing video: {result.stderr}")
+                print(f"✗ Error processing video: {stderr}")
                 return False, None
         except Exception as e:
             print(f"✗ Error: {str(e)}")
@@ -371,11 +754,18 @@ class VideoRemixer:
     
     def process_all_videos(self):
         """Process all videos in the input directory"""
-        video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.webm']
-        video_files = []
+        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.webm'}
         
-        for ext in video_extensions:
-            video_files.extend(self.input_dir.glob(f"*{ext}"))
+        if not self.input_dir.is_dir():
+            print(f"No video files found in {self.input_dir}")
+            return
+        
+        # One directory pass; DirEntry.is_file() uses the type from readdir and only
+        # stats symlinks
+        with os.scandir(self.input_dir) as entries:
+            video_files = sorted(Path(entry.path) for entry in entries
+                                 if entry.is_file()
+                                 and os.path.splitext(entry.name)[1].lower() in video_extensions)
         
         if not video_files:
             print(f"No video files found in {self.input_dir}")
@@ -384,16 +774,63 @@ class VideoRemixer:
         print(f"Found {len(video_files)} video(s) to process")
         print("=" * 50)
         
+        originals = {}
+        if self.report:
+            # Warm the page cache, then read every original's metadata in one exiftool request
+            _prefetch_metadata(video_files)
+            print("Capturing original metadata...")
+            originals = self.get_exif_batch(video_files)
+        
         successful = 0
         failed = 0
         
-        for video_file in video_files:
-            success, _ = self.process_video(video_file)
+        print(f"Using encoder: {self._detect_hw_encoder()}")
+        
+        # Run several ffmpeg encodes side by side, each limited to a few threads
+        cpu_count = os.cpu_count() or 1
+        default_threads = self.threads_per_job or min(DEFAULT_THREADS_PER_JOB, cpu_count)
+        jobs = min(self.jobs or max(1, cpu_count // default_threads), len(video_files))
+        # Unless set explicitly, share all CPUs among the jobs so few files still use every core
+        threads = self.threads_per_job or max(1, cpu_count // jobs)
+        
+        if jobs > 1:
+            print(f"Running {jobs} jobs with {threads} threads each")
+            # Pin workers only when each can get a disjoint set of CPUs
+            initargs = ()
+            if hasattr(os, "sched_getaffinity") and jobs * threads <= len(os.sched_getaffinity(0)):
+                initargs = (multiprocessing.Value('i', 0), threads)
+            results = []
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                     initargs=initargs) as ex:
+                # Draw parameters here, in file order, so a --seed run is reproducible
+                # no matter which worker picks up which file
+                futures = {ex.submit(_process_one, self, video_file, threads,
+                                     self.get_random_parameters(),
+                                     originals.get(str(video_file))): video_file
+                           for video_file in video_files}
+                for done, future in enumerate(as_completed(futures), 1):
+                    video_file = futures[future]
+                    try:
+                        success, output_path, log = future.result()
+                        print(log, end="")
+                    except Exception as e:
+                        print(f"✗ Error: {str(e)}")
+                        success, output_path = False, None
+                    print(f"[{done}/{len(video_files)}] {'✓' if success else '✗'} {video_file.name}")
+                    print("-" * 50)
+                    results.append((success, output_path))
+        else:
+            results = []
+            for video_file in video_files:
+                results.append(self.process_video(
+                    video_file, original_exif=originals.get(str(video_file))))
+                print("-" * 50)
+        
+        for success, _ in results:
             if success:
                 successful += 1
             else:
                 failed += 1
-            print("-" * 50)
         
         print("\n" + "=" * 50)
         print(f"Processing complete!")
@@ -410,7 +847,7 @@ This script applies random transformations to videos:
 - Adjusts zoom, playback speed, colors, and audio
 - Adds noise, sharpness, and other effects
 - Modifies encoding parameters
-- ADDS FAKE IPHONE METADATA using FFmpeg and exiftool
+- ADDS FAKE IPHONE METADATA in the FFmpeg encode
 - Saves remixed videos with authentic-looking iPhone metadata
 
 Examples:
@@ -420,6 +857,10 @@ Examples:
   python remix_videos.py --show-params
   python remix_videos.py --remove-audio
   python remix_videos.py --single video.mp4 --remove-audio
+  python remix_videos.py --jobs 4 --threads-per-job 2
+  python remix_videos.py --encoder libx264
+  python remix_videos.py --report
+  python remix_videos.py --seed 42
         """
     )
     
@@ -433,10 +874,28 @@ Examples:
                         help='Show random parameters without processing')
     parser.add_argument('--remove-audio', action='store_true',
                         help='Remove audio from all processed videos')
+    parser.add_argument('--jobs', type=int,
+                        help=f'Number of videos to process in parallel, capped at the number of files '
+                             f'(default: CPU count / --threads-per-job, or / {DEFAULT_THREADS_PER_JOB} if unset)')
+    parser.add_argument('--threads-per-job', type=int,
+                        help='FFmpeg threads per video (default: CPU count / jobs; '
+                             'FFmpeg decides when only one video runs)')
+    parser.add_argument('--encoder', choices=['auto'] + H264_ENCODERS, default='auto',
+                        help='H.264 encoder to use (default: auto, prefers hardware encoders)')
+    parser.add_argument('--seed', type=int,
+                        help='Seed the random parameters for a reproducible run')
+    parser.add_argument('--report', action='store_true',
+                        help=f'Compare metadata with exiftool and append it to {REPORTS_FILENAME}')
     
     args = parser.parse_args()
     
-    remixer = VideoRemixer(args.input, args.output, args.remove_audio)
+    if args.seed is not None:
+        _rng.seed(args.seed)
+    
+    remixer = VideoRemixer(args.input, args.output, args.remove_audio,
+                           jobs=args.jobs, threads_per_job=args.threads_per_job,
+                           encoder=None if args.encoder == 'auto' else args.encoder,
+                           report=args.report)
     
     if args.show_params:
         params = remixer.get_random_parameters()